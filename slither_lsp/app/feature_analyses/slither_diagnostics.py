@@ -23,7 +23,7 @@ class SlitherDiagnostics:
         self.context = context
 
         # Define a lookup of file uri -> diagnostics. This is necessary so we can track non-existent diagnostics.
-        self.diagnostics: Dict[str, lsp.PublishDiagnosticsParams] = {}
+        self.diagnostics: Dict[str, List[lsp.Diagnostic]] = {}
 
         # TODO: Detector filters
 
@@ -39,7 +39,7 @@ class SlitherDiagnostics:
         :return: None
         """
         # Create a new diagnostics array which our current array will be swapped to later.
-        new_diagnostics: Dict[str, lsp.PublishDiagnosticsParams] = {}
+        new_diagnostics: Dict[str, List[lsp.Diagnostic]] = {}
 
         # Convert our hidden checks to a set
         hidden_checks = set(detector_settings.hidden_checks)
@@ -63,35 +63,27 @@ class SlitherDiagnostics:
                     if detector_result.check in hidden_checks:
                         continue
 
-                    # Obtain the target filename for this finding (the first element is the most significant)
-                    target_result_element = detector_result.elements[0]
-                    target_uri = fs_path_to_uri(
-                        target_result_element.source_mapping.filename_absolute
-                    )
+                    # Obtain the target source mapping for this finding (the first element is the most significant)
+                    source_mapping = detector_result.elements[0].source_mapping
+                    target_uri = fs_path_to_uri(source_mapping.filename_absolute)
 
-                    # Obtain our params for this file uri, or create them if they haven't been yet.
-                    params = new_diagnostics.get(target_uri, None)
-                    if params is None:
-                        params = lsp.PublishDiagnosticsParams(
-                            uri=target_uri, version=None, diagnostics=[]
-                        )
-                        new_diagnostics[target_uri] = params
+                    # Obtain our diagnostics for this file uri, or create them if they haven't been yet.
+                    file_diagnostics = new_diagnostics.get(target_uri, None)
+                    if file_diagnostics is None:
+                        file_diagnostics = []
+                        new_diagnostics[target_uri] = file_diagnostics
 
                     # Add our detector result as a diagnostic.
-                    params.diagnostics.append(
+                    file_diagnostics.append(
                         lsp.Diagnostic(
                             lsp.Range(
                                 start=lsp.Position(
-                                    line=target_result_element.source_mapping.lines[0]
-                                    - 1,
-                                    character=target_result_element.source_mapping.starting_column
-                                    - 1,
+                                    line=source_mapping.lines[0] - 1,
+                                    character=source_mapping.starting_column - 1,
                                 ),
                                 end=lsp.Position(
-                                    line=target_result_element.source_mapping.lines[-1]
-                                    - 1,
-                                    character=target_result_element.source_mapping.ending_column
-                                    - 1,
+                                    line=source_mapping.lines[-1] - 1,
+                                    character=source_mapping.ending_column - 1,
                                 ),
                             ),
                             message=f"[{detector_result.impact.upper()}] {detector_result.description}",
@@ -102,7 +94,7 @@ class SlitherDiagnostics:
                     )
 
         # Clear any diagnostics for files that no longer have any.
-        files_to_clear: Set[str] = set(self.diagnostics) - set(new_diagnostics)
+        files_to_clear: Set[str] = self.diagnostics.keys() - new_diagnostics.keys()
         for file_to_clear in files_to_clear:
             self._clear_single(file_to_clear, False)
 
@@ -110,10 +102,8 @@ class SlitherDiagnostics:
         self.diagnostics = new_diagnostics
 
         # Loop for each diagnostic and broadcast all of them.
-        for diagnostic_params in self.diagnostics.values():
-            self.context.publish_diagnostics(
-                diagnostic_params.uri, diagnostics=diagnostic_params.diagnostics
-            )
+        for file_uri, file_diagnostics in self.diagnostics.items():
+            self.context.publish_diagnostics(file_uri, diagnostics=file_diagnostics)
 
     def _clear_single(self, file_uri: str, clear_from_lookup: bool = False) -> None:
         """
@@ -136,7 +126,7 @@ class SlitherDiagnostics:
         :return: None
         """
         # Loop through all diagnostic files, publish new diagnostics for each file with no items.
-        for file_uri, _ in self.diagnostics:
+        for file_uri in self.diagnostics:
             self._clear_single(file_uri, False)
 
         # Clear the dictionary
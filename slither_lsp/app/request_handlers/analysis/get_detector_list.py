@@ -1,17 +1,21 @@
 # pylint: disable=unused-argument
 
+from functools import lru_cache
+
 from pygls.server import LanguageServer
-from slither.__main__ import get_detectors_and_printers, output_detectors_json
+from slither.__main__ import output_detectors_json
+
+from slither_lsp.app.utils.detectors import get_detector_classes
+
+
+@lru_cache(maxsize=1)
+def _get_detector_types_json():
+    # The set of installed detectors cannot change while the server is running, so this is computed once.
+    return output_detectors_json(get_detector_classes())
 
 
 def get_detector_list(ls: LanguageServer, params):
     """
     Handler which invokes slither to obtain a list of all detectors and some properties that describe them.
     """
-
-    # Obtain a list of detectors
-    detectors, _ = get_detectors_and_printers()
-
-    # Obtain the relevant object to be output as JSON.
-    detector_types_json = output_detectors_json(detectors)
-    return detector_types_json
+    return _get_detector_types_json()
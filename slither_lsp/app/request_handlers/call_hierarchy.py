@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from slither_lsp.app.slither_server import SlitherServer
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CallItem:
     name: str
     range: Range
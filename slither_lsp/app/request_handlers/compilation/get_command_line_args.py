@@ -1,16 +1,14 @@
 # pylint: disable=protected-access, unused-argument
 
 from argparse import ArgumentParser
+from functools import lru_cache
 
 from crytic_compile.cryticparser.cryticparser import init as crytic_parser_init
 from pygls.server import LanguageServer
 
 
-def get_command_line_args(ls: LanguageServer, params):
-    """
-    Handler which obtains data regarding all command line arguments available in crytic-compile.
-    """
-
+@lru_cache(maxsize=1)
+def _get_command_line_args():
     # Read our argument parser
     parser = ArgumentParser()
     crytic_parser_init(parser)
@@ -38,3 +36,11 @@ def get_command_line_args(ls: LanguageServer, params):
 
     # Return our argument group -> arguments hierarchy.
     return results
+
+
+def get_command_line_args(ls: LanguageServer, params):
+    """
+    Handler which obtains data regarding all command line arguments available in crytic-compile.
+    """
+
+    return _get_command_line_args()
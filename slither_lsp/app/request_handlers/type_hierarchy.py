@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from slither_lsp.app.slither_server import SlitherServer
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeItem:
     name: str
     range: Range
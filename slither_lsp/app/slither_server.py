@@ -5,7 +5,7 @@ from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from threading import Lock
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Dict, List, Optional, Set, Tuple, Type
 from os.path import split
 
 import lsprotocol.types as lsp
@@ -17,9 +17,6 @@ from slither import Slither
 from slither.__main__ import (
     _process as process_detectors_and_printers,
 )
-from slither.__main__ import (
-    get_detectors_and_printers,
-)
 
 from slither_lsp.app.feature_analyses.slither_diagnostics import SlitherDiagnostics
 from slither_lsp.app.logging import LSPHandler
@@ -48,6 +45,7 @@ from slither_lsp.app.types.params import (
     SLITHER_ANALYZE,
     AnalysisRequestParams,
 )
+from slither_lsp.app.utils.detectors import get_detector_classes
 from slither_lsp.app.utils.file_paths import normalize_uri, uri_to_fs_path
 
 # TODO(frabert): Maybe this should be upstreamed? https://github.com/openlawlibrary/pygls/discussions/338
@@ -80,6 +78,9 @@ class SlitherServer(LanguageServer):
     workspaces: Dict[str, AnalysisResult] = {}
     # `workspace_in_progress[uri]` is locked if there's a compilation in progress for the workspace `uri`
     workspace_in_progress: Dict[str, Lock] = defaultdict(Lock)
+    # `workspace_queued` contains `uri` if a compilation for the workspace `uri` is queued but has not started yet
+    workspace_queued: Set[str] = set()
+    workspace_queued_lock: Lock = Lock()
 
     @property
     def analyses(self) -> List[AnalysisResult]:
@@ -181,14 +182,29 @@ class SlitherServer(LanguageServer):
         path = uri_to_fs_path(uri)
         workspace_name = split(path)[1]
 
+        # A compilation that hasn't started yet will already pick up the latest state of the workspace,
+        # so a burst of requests for the same workspace only needs to queue one.
+        with self.workspace_queued_lock:
+            already_queued = uri in self.workspace_queued
+            self.workspace_queued.add(uri)
+        if already_queued:
+            self.show_message(
+                f"Compilation for {workspace_name} is already queued",
+                lsp.MessageType.Warning,
+            )
+            return
+
         def do_compile():
-            detector_classes, _ = get_detectors_and_printers()
             with self.workspace_in_progress[uri]:
+                # Leave the queue before doing anything that can fail, so later requests can queue a new compilation.
+                with self.workspace_queued_lock:
+                    self.workspace_queued.discard(uri)
                 self.show_message(
                     f"Compilation for {workspace_name} has started",
                     lsp.MessageType.Info,
                 )
                 try:
+                    detector_classes = get_detector_classes()
                     compilation = CryticCompile(path)
                     analysis = Slither(compilation)
                     _, detector_results, _, _ = process_detectors_and_printers(
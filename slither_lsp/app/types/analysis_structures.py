@@ -60,11 +60,12 @@ class SlitherDetectorResultElement:
 
     @staticmethod
     def from_dict(dict_):
+        source_mapping = dict_["source_mapping"]
         return SlitherDetectorResultElement(
             name=dict_["name"],
             source_mapping=(
-                SlitherDetectorResultElementSourceMapping(**dict_["source_mapping"])
-                if dict_["source_mapping"]
+                SlitherDetectorResultElementSourceMapping(**source_mapping)
+                if source_mapping
                 else None
             ),
             type=dict_["type"],
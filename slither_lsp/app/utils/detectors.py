@@ -0,0 +1,17 @@
+from functools import lru_cache
+from typing import List, Type
+
+from slither.__main__ import get_detectors_and_printers
+from slither.detectors.abstract_detector import AbstractDetector
+
+
+@lru_cache(maxsize=1)
+def get_detector_classes() -> List[Type[AbstractDetector]]:
+    """
+    Obtains all detector classes known to slither, including those provided by plugins.
+    Slither discovers these by introspection, and they cannot change while the server is running,
+    so the discovery is only performed once.
+    :return: A list of slither detector classes.
+    """
+    detector_classes, _ = get_detectors_and_printers()
+    return detector_classes
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Iterable, Set
 from urllib.parse import unquote_plus, urlparse, urljoin
 from urllib.request import url2pathname, pathname2url
@@ -9,6 +10,7 @@ def is_solidity_file(path: str) -> bool:
     return file_extension is not None and file_extension.lower() == ".sol"
 
 
+@lru_cache(maxsize=128)
 def uri_to_fs_path(uri: str) -> str:
     path = url2pathname(unquote_plus(urlparse(uri).path))
     return path
@@ -18,6 +20,7 @@ def normalize_uri(uri: str) -> str:
     return fs_path_to_uri(uri_to_fs_path(uri))
 
 
+@lru_cache(maxsize=4096)
 def fs_path_to_uri(path: str) -> str:
     uri = urljoin("file:", pathname2url(path))
     return uri